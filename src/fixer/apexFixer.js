@@ -1,4 +1,5 @@
 import { readFile, writeFile, copyFile } from 'fs/promises';
+import { constants } from 'fs';
 import { join } from 'path';
 import { CRUDFix } from './fixStrategies/crudFix.js';
 import { SharingFix } from './fixStrategies/sharingFix.js';
@@ -48,9 +49,10 @@ export class ApexFixer {
     
     for (const [filePath, fileViolations] of Object.entries(violationsByFile)) {
       try {
-        await this.backupFile(filePath);
-        
-        let content = await readFile(filePath, 'utf-8');
+        const content = await readFile(filePath, 'utf-8');
+        // Split once per file; strategies edit lines in place, bottom-up,
+        // so earlier line numbers stay valid
+        const lines = content.split('\n');
         let modified = false;
         
         const sortedViolations = fileViolations.sort((a, b) => b.line - a.line);
@@ -76,10 +78,9 @@ export class ApexFixer {
           
           if (strategy) {
             try {
-              const result = await strategy.apply(content, violation);
+              const result = await strategy.apply(lines, violation);
               
               if (result.success) {
-                content = result.content;
                 modified = true;
                 fixed.push({
                   violation,
@@ -100,8 +101,10 @@ export class ApexFixer {
           }
         }
         
+        // Only files that are about to be rewritten need a backup
         if (modified) {
-          await writeFile(filePath, content, 'utf-8');
+          await this.backupFile(filePath);
+          await writeFile(filePath, lines.join('\n'), 'utf-8');
           updatedFiles.add(filePath);
         }
         
@@ -138,7 +141,9 @@ export class ApexFixer {
   async backupFile(filePath) {
     const backupPath = `${filePath}.backup`;
     try {
-      await copyFile(filePath, backupPath);
+      // Clone (copy-on-write) where the filesystem supports it, plain copy otherwise.
+      // A hard link would not do: writeFile truncates the shared inode.
+      await copyFile(filePath, backupPath, constants.COPYFILE_FICLONE);
     } catch (error) {
       console.warn(`Warning: Could not create backup for ${filePath}`);
     }
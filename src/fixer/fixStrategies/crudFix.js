@@ -1,7 +1,25 @@
+import { LruCache } from '../../lruCache.js';
+
+const SECURITY_ENFORCED_PATTERN = /WITH\s+SECURITY_ENFORCED/i;
+// One whitespace character, then a bracket-free run: no two adjacent quantifiers can
+// trade characters, so a '[SELECT' without a closing ']' fails without backtracking
+const SOQL_QUERY_PATTERN = /\[SELECT\s[^\]\n\r\u2028\u2029]*\]/i;
+const SOQL_CLOSE_PATTERN = /\]/;
+const INDENTATION_PATTERN = /^(\s*)/;
+const OPERATION_PATTERNS = [
+  [/\binsert\b/i, 'insert'],
+  [/\bupdate\b/i, 'update'],
+  [/\bdelete\b/i, 'delete'],
+  [/\bupsert\b/i, 'upsert'],
+  [/\[SELECT\b/i, 'SOQL']
+];
+
+// Security check lines per (operation, sObject), least recently used evicted first
+const securityCheckCache = new LruCache(1024);
+
 export class CRUDFix {
-  async apply(content, violation) {
+  async apply(lines, violation) {
     try {
-      const lines = content.split('\n');
       const lineIndex = violation.line - 1;
       
       if (lineIndex < 0 || lineIndex >= lines.length) {
@@ -18,18 +36,17 @@ export class CRUDFix {
       
       // Handle SOQL queries with WITH SECURITY_ENFORCED (AUTO_SAFE)
       if (opType === 'SOQL' || opType === 'read') {
-        if (/WITH\s+SECURITY_ENFORCED/i.test(line)) {
+        if (SECURITY_ENFORCED_PATTERN.test(line)) {
           return { success: false, reason: 'WITH SECURITY_ENFORCED already present' };
         }
         
-        if (!/\[SELECT\s+.*?\]/i.test(line)) {
+        if (!SOQL_QUERY_PATTERN.test(line)) {
           return { success: false, reason: 'Could not parse SOQL query' };
         }
         
-        lines[lineIndex] = line.replace(/\]/i, ' WITH SECURITY_ENFORCED]');
+        lines[lineIndex] = line.replace(SOQL_CLOSE_PATTERN, ' WITH SECURITY_ENFORCED]');
         return {
           success: true,
-          content: lines.join('\n'),
           description: 'Added WITH SECURITY_ENFORCED to SOQL query'
         };
       }
@@ -43,9 +60,9 @@ export class CRUDFix {
       }
       
       const operation = opType;
-      const checkCode = this.generateSecurityCheck(context.sobject, operation);
+      const checkLines = this.getSecurityCheckLines(context.sobject, operation);
       
-      if (!checkCode) {
+      if (!checkLines) {
         return {
           success: false,
           reason: 'Cannot generate security check'
@@ -53,13 +70,12 @@ export class CRUDFix {
       }
       
       const indentation = this.getIndentation(line);
-      const securityCheckLines = checkCode.split('\n').map(l => indentation + l);
+      const securityCheckLines = checkLines.map(l => indentation + l);
       
       lines.splice(lineIndex, 0, ...securityCheckLines);
       
       return {
         success: true,
-        content: lines.join('\n'),
         description: `Added ${operation} security check for ${context.sobject}`
       };
       
@@ -72,14 +88,29 @@ export class CRUDFix {
   }
 
   detectOperation(line) {
-    if (/\binsert\b/i.test(line)) return 'insert';
-    if (/\bupdate\b/i.test(line)) return 'update';
-    if (/\bdelete\b/i.test(line)) return 'delete';
-    if (/\bupsert\b/i.test(line)) return 'upsert';
-    if (/\[SELECT\b/i.test(line)) return 'SOQL';
+    for (const [pattern, operation] of OPERATION_PATTERNS) {
+      if (pattern.test(line)) return operation;
+    }
     return 'access';
   }
 
+  /**
+   * Returns the security check for a DML operation split into lines, or null.
+   * Files typically repeat the same few (operation, sObject) pairs, so results are memoized.
+   */
+  getSecurityCheckLines(sobject, operation) {
+    const key = `${operation}:${sobject}`;
+    let checkLines = securityCheckCache.get(key);
+    
+    if (checkLines === undefined) {
+      const checkCode = this.generateSecurityCheck(sobject, operation);
+      checkLines = checkCode ? checkCode.split('\n') : null;
+      securityCheckCache.set(key, checkLines);
+    }
+    
+    return checkLines;
+  }
+
   generateSecurityCheck(sobject, operation) {
     switch (operation) {
       case 'insert':
@@ -96,7 +127,7 @@ export class CRUDFix {
   }
 
   getIndentation(line) {
-    const match = line.match(/^(\s*)/);
+    const match = line.match(INDENTATION_PATTERN);
     return match ? match[1] : '';
   }
 }
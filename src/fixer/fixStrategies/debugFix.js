@@ -1,7 +1,8 @@
+const DEBUG_STATEMENT_PATTERN = /System\.debug\s*\([^)]*\)\s*;?/gi;
+
 export class DebugFix {
-  async apply(content, violation) {
+  async apply(lines, violation) {
     try {
-      const lines = content.split('\n');
       const lineIndex = violation.line - 1;
       
       if (lineIndex < 0 || lineIndex >= lines.length) {
@@ -20,13 +21,12 @@ export class DebugFix {
         };
       }
       
-      line = line.replace(/System\.debug\s*\([^)]*\)\s*;?/gi, '// System.debug removed');
+      line = line.replace(DEBUG_STATEMENT_PATTERN, '// System.debug removed');
       
       lines[lineIndex] = line;
       
       return {
         success: true,
-        content: lines.join('\n'),
         description: 'Removed System.debug() statement'
       };
       
@@ -1,7 +1,8 @@
+const CLASS_DECLARATION_PATTERN = /^(\s*)(public|global)\s+(abstract\s+)?(class|interface)\s+(\w+)/i;
+
 export class SharingFix {
-  async apply(content, violation) {
+  async apply(lines, violation) {
     try {
-      const lines = content.split('\n');
       const lineIndex = violation.line - 1;
       
       if (lineIndex < 0 || lineIndex >= lines.length) {
@@ -12,7 +13,7 @@ export class SharingFix {
       }
       
       const line = lines[lineIndex];
-      const classMatch = line.match(/^(\s*)(public|global)\s+(abstract\s+)?(class|interface)\s+(\w+)/);
+      const classMatch = line.match(CLASS_DECLARATION_PATTERN);
       
       if (!classMatch) {
         return {
@@ -33,7 +34,6 @@ export class SharingFix {
       
       return {
         success: true,
-        content: lines.join('\n'),
         description: `Added 'with sharing' to class ${className}`
       };
       
@@ -1,7 +1,6 @@
 export class WhitespaceFix {
-  async apply(content, violation) {
+  async apply(lines, violation) {
     try {
-      const lines = content.split('\n');
       const lineIndex = violation.line - 1;
       
       if (lineIndex < 0 || lineIndex >= lines.length) {
@@ -12,13 +11,14 @@ export class WhitespaceFix {
       }
       
       const line = lines[lineIndex];
-      const trimmedLine = line.replace(/\s+$/, '');
+      // trimEnd strips the same characters as /\s+$/, without the regex
+      // retrying every whitespace run (quadratic on long runs of spaces)
+      const trimmedLine = line.trimEnd();
       
       lines[lineIndex] = trimmedLine;
       
       return {
         success: true,
-        content: lines.join('\n'),
         description: 'Removed trailing whitespace'
       };
       
@@ -3,6 +3,7 @@
 import { fileURLToPath } from 'url';
 import { dirname, join, resolve } from 'path';
 import { existsSync, readFileSync } from 'fs';
+import os from 'os';
 import { ApexScanner } from './scanner/apexScanner.js';
 import { ApexFixer } from './fixer/apexFixer.js';
 import { Verifier } from './verifier/verifier.js';
@@ -17,6 +18,8 @@ class SalesforceAnalyzer {
     this.targetPath = options.targetPath || process.cwd();
     this.autoFix = options.autoFix || false;
     this.includeTestClasses = options.includeTestClasses !== undefined ? options.includeTestClasses : false;
+    this.workers = options.workers || 1;
+    this.fastPrefilter = options.fastPrefilter || false;
     this.outputDir = options.outputDir || join(process.cwd(), 'reports');
   }
 
@@ -24,7 +27,9 @@ class SalesforceAnalyzer {
     this.printHeader();
 
     const scanner = new ApexScanner(this.targetPath, {
-      includeTestClasses: this.includeTestClasses
+      includeTestClasses: this.includeTestClasses,
+      workers: this.workers,
+      fastPrefilter: this.fastPrefilter
     });
     const scanResults = await scanner.scan();
     
@@ -120,6 +125,7 @@ class SalesforceAnalyzer {
   printScanResults(results) {
     console.log(`\nScanned: ${results.filesScanned} files`);
     console.log(`Violations: ${results.totalViolations}`);
+  }
   
   printTestClassInfo(results) {
     const testViolations = results.violations.filter(v => v.isTestCode);
@@ -131,7 +137,6 @@ class SalesforceAnalyzer {
       console.log(`\nTest Classes: Skipped (use --includeTestClasses to scan)`);
     }
   }
-  }
 
   printPriorityBreakdown(prioritizedResults) {
     const summary = prioritizedResults.summary;
@@ -249,7 +254,21 @@ function resolveTargetPath(args) {
   return process.cwd();
 }
 
-if (import.meta.url === `file://${process.argv[1]}`) {
+/**
+ * Resolves a workers setting to a thread count.
+ * 'auto' uses one worker per available CPU; invalid values fall back to 1 (serial).
+ * 
+ * @param {string|number} value - Setting from the CLI or config file
+ * @returns {number} Number of worker threads
+ */
+function resolveWorkerCount(value) {
+  if (value === 'auto') {
+    // os.availableParallelism() only exists from Node 18.14
+    return os.availableParallelism ? os.availableParallelism() : os.cpus().length || 1;
+  }
+  return parseInt(value, 10) || 1;
+}
+
 /**
  * Resolves configuration options from CLI arguments and config file.
  * CLI arguments take priority over config file.
@@ -259,7 +278,9 @@ if (import.meta.url === `file://${process.argv[1]}`) {
  */
 function resolveConfig(args) {
   const config = {
-    includeTestClasses: false
+    includeTestClasses: false,
+    workers: 1,
+    fastPrefilter: false
   };
   
   // Load from config file first
@@ -271,6 +292,12 @@ function resolveConfig(args) {
       if (fileConfig.includeTestClasses !== undefined) {
         config.includeTestClasses = fileConfig.includeTestClasses;
       }
+      if (fileConfig.workers !== undefined) {
+        config.workers = resolveWorkerCount(fileConfig.workers);
+      }
+      if (fileConfig.fastPrefilter !== undefined) {
+        config.fastPrefilter = fileConfig.fastPrefilter;
+      }
     } catch (error) {
       // Config file parsing errors are already handled in resolveTargetPath
     }
@@ -281,17 +308,29 @@ function resolveConfig(args) {
     config.includeTestClasses = true;
   }
   
+  const workersIndex = args.indexOf('--workers');
+  if (workersIndex !== -1 && args[workersIndex + 1]) {
+    config.workers = resolveWorkerCount(args[workersIndex + 1]);
+  }
+  
+  if (args.includes('--fast-prefilter')) {
+    config.fastPrefilter = true;
+  }
+  
   return config;
 }
 
+if (import.meta.url === `file://${process.argv[1]}`) {
   const args = process.argv.slice(2);
-  const analyzer = new SalesforceAnalyzer({
   const config = resolveConfig(args);
   
+  const analyzer = new SalesforceAnalyzer({
     targetPath: resolveTargetPath(args),
     autoFix: args.includes('--autoFix') || args.includes('--fix'),
-    outputDir: join(process.cwd(), 'reports')
+    outputDir: join(process.cwd(), 'reports'),
     includeTestClasses: config.includeTestClasses,
+    workers: config.workers,
+    fastPrefilter: config.fastPrefilter
   });
 
   analyzer.run().catch(err => console.error('Error:', err));
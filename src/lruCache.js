@@ -0,0 +1,30 @@
+/**
+ * Bounded map that evicts the least recently used entry once full.
+ * Relies on Map iterating keys in insertion order: reads re-insert the key,
+ * so the first key is always the least recently used one.
+ * undefined is not a storable value; get() returns it for missing keys.
+ */
+export class LruCache {
+  constructor(maxSize) {
+    this.maxSize = maxSize;
+    this.entries = new Map();
+  }
+
+  get(key) {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      // Refresh recency
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxSize) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+    this.entries.set(key, value);
+  }
+}
@@ -1,86 +1,29 @@
-import { mkdir, writeFile } from 'fs/promises';
+import { mkdir, open } from 'fs/promises';
 import { join } from 'path';
-import { PriorityRenderer } from './priorityRenderer.js';
-import { SalesforceQueryRenderer } from './salesforceQueryRenderer.js';
 
-export class HtmlReporter {
-  constructor(outputDir) {
-    this.outputDir = outputDir;
-  }
-
-  async generate(data) {
-    await mkdir(this.outputDir, { recursive: true });
-
-    const html = this.buildReportWithFixes(data);
-    
-    const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-    const filename = `salesforce-analysis-${timestamp}.html`;
-    const reportPath = join(this.outputDir, filename);
-
-    await writeFile(reportPath, html, 'utf-8');
-
-    return reportPath;
-  }
-
-  buildReportWithFixes(data) {
-    const { scanResults, prioritizedResults, fixResults, autoFixEnabled, originalResults } = data;
-    
-    const originalTotal = originalResults?.totalViolations || scanResults.totalViolations;
-    const fixedCount = fixResults?.fixed?.length || 0;
-    const remainingCount = scanResults.totalViolations;
-    const failedCount = fixResults?.failed?.length || 0;
-    
-    return `<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Salesforce Code Analyzer Report with Remediation</title>
-    ${this.getStyles()}
-</head>
-<body>
-    <div class="container">
-        ${this.buildHeader()}
-        ${this.buildRemediationSummary(originalTotal, fixedCount, remainingCount, failedCount, autoFixEnabled)}
-        ${this.buildViolationsByTier(prioritizedResults, fixResults)}
-        ${this.buildFooter()}
-    </div>
-</body>
-</html>`;
-  }
-
-  buildHtml(data) {
-    const { scanResults, fixResults, verificationResults, autoFixEnabled } = data;
-    const prioritizedResults = data.prioritizedResults;
-    
-    const priorityRenderer = prioritizedResults ? new PriorityRenderer() : null;
-    
-    return `<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Salesforce Code Analysis Report</title>
-    ${this.getStyles()}
-</head>
-<body>
-    <div class="container">
-        ${this.buildHeader()}
-        ${priorityRenderer ? priorityRenderer.renderSummaryBanner(prioritizedResults) : ''}
-        ${priorityRenderer ? priorityRenderer.renderAllTiers(prioritizedResults, fixResults) : 
-          this.buildExecutiveSummary(scanResults, fixResults, autoFixEnabled) + 
-          this.buildAutoFixedSection(fixResults)}
-        ${this.buildNotAutoFixableSection(scanResults, fixResults)}
-        ${this.buildFileLevelSummary(scanResults, fixResults)}
-        ${this.buildVerificationSection(verificationResults)}
-        ${this.buildFooter()}
-    </div>
-</body>
-</html>`;
-  }
+// Rendered chunks are buffered up to this many characters per write
+const WRITE_BUFFER_SIZE = 1 << 20;
+
+const HTML_ENTITIES = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#039;'
+};
+const HTML_SPECIAL_CHARS = /[&<>"']/g;
+const HTML_SPECIAL_CHAR = /[&<>"']/;
+
+function escapeHtml(text) {
+  const value = String(text);
+  // Most values contain nothing to escape; skip the replace pass for those
+  return HTML_SPECIAL_CHAR.test(value)
+    ? value.replace(HTML_SPECIAL_CHARS, char => HTML_ENTITIES[char])
+    : value;
+}
 
-  getStyles() {
-    return `<style>
+// Static stylesheet, shared by every report
+const REPORT_STYLES = `<style>
         /* Priority-specific styles */
         .priority-banner {
             background: linear-gradient(135deg, #fc5c7d 0%, #6a82fb 100%);
@@ -462,177 +405,84 @@ export class HtmlReporter {
             margin-bottom: 10px;
         }
     </style>`;
-  }
 
-  buildHeader() {
-    return `<div class="header">
-        <h1>🔍 Salesforce Security Review</h1>
-        <p>Static Analysis Report • Generated on ${new Date().toLocaleString()}</p>
-    </div>`;
-  }
-
-  buildExecutiveSummary(scanResults, fixResults, autoFixEnabled) {
-    const totalFiles = scanResults.filesScanned;
-    const totalViolations = scanResults.totalViolations;
-    const fixedCount = fixResults.fixed.length;
-    const remainingCount = totalViolations - fixedCount;
+// Fixed document shell around the streamed report sections
+const REPORT_HEAD = `<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Salesforce Code Analyzer Report with Remediation</title>
+    ${REPORT_STYLES}
+</head>
+<body>
+    <div class="container">
+        `;
+const REPORT_TAIL = `
+    </div>
+</body>
+</html>`;
 
-    return `<div class="section">
-        <h2 class="section-title">Executive Summary</h2>
-        <div class="summary-grid">
-            <div class="summary-card">
-                <h3>Files Scanned</h3>
-                <div class="value">${totalFiles}</div>
-            </div>
-            <div class="summary-card danger">
-                <h3>Total Violations</h3>
-                <div class="value">${totalViolations}</div>
-            </div>
-            <div class="summary-card success">
-                <h3>Auto-Fixed</h3>
-                <div class="value">${fixedCount}</div>
-            </div>
-            <div class="summary-card warning">
-                <h3>Remaining</h3>
-                <div class="value">${remainingCount}</div>
-            </div>
-        </div>
-        ${!autoFixEnabled ? '<p style="padding: 15px; background: #fff3cd; border-radius: 5px; color: #856404;"><strong>Note:</strong> Auto-fix was disabled. Run with --autoFix to apply automatic fixes.</p>' : ''}
-    </div>`;
+export class HtmlReporter {
+  constructor(outputDir) {
+    this.outputDir = outputDir;
   }
 
-  buildAutoFixedSection(fixResults) {
-    if (fixResults.fixed.length === 0) {
-      return `<div class="section">
-          <h2 class="section-title">✅ Auto-Fixed Issues</h2>
-          <div class="empty-state">
-              <div class="empty-state-icon">📭</div>
-              <p>No issues were auto-fixed</p>
-          </div>
-      </div>`;
-    }
-
-    const violationsHtml = fixResults.fixed.map(item => {
-      const v = item.violation;
-      return `<div class="violation-item fixed">
-          <div class="violation-header">
-              <span class="violation-rule">${v.rule}</span>
-              <span class="severity-badge ${v.severity.toLowerCase()}">${v.severity}</span>
-          </div>
-          <div class="violation-details">
-              <p><strong>File:</strong> ${v.filePath}</p>
-              <p><strong>Location:</strong> <span class="violation-location">Line ${v.line}, Column ${v.column}</span></p>
-              <p><strong>Description:</strong> ${v.description}</p>
-          </div>
-          <div class="fix-description">
-              <strong>✓ Fix Applied:</strong> ${item.fixApplied}
-          </div>
-      </div>`;
-    }).join('');
+  async generate(data) {
+    await mkdir(this.outputDir, { recursive: true });
 
-    return `<div class="section">
-        <h2 class="section-title">✅ Auto-Fixed Issues (${fixResults.fixed.length})</h2>
-        <div class="violation-list">${violationsHtml}</div>
-    </div>`;
-  }
+    const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
+    const filename = `salesforce-analysis-${timestamp}.html`;
+    const reportPath = join(this.outputDir, filename);
 
-  buildNotAutoFixableSection(scanResults, fixResults) {
-    const fixedRuleLines = new Set(
-      fixResults.fixed.map(f => `${f.violation.rule}-${f.violation.filePath}-${f.violation.line}`)
-    );
-
-    const notFixed = scanResults.violations.filter(v =>
-      !fixedRuleLines.has(`${v.rule}-${v.filePath}-${v.line}`)
-    );
-
-    if (notFixed.length === 0) {
-      return `<div class="section">
-          <h2 class="section-title">⚠️ Not Auto-Fixable Issues</h2>
-          <div class="empty-state">
-              <div class="empty-state-icon">🎉</div>
-              <p>All issues have been fixed!</p>
-          </div>
-      </div>`;
+    // Stream the report section by section instead of materializing the whole document
+    const file = await open(reportPath, 'w');
+    try {
+      let buffer = '';
+      for (const chunk of this.renderReportWithFixes(data)) {
+        buffer += chunk;
+        if (buffer.length >= WRITE_BUFFER_SIZE) {
+          await file.write(buffer, null, 'utf-8');
+          buffer = '';
+        }
+      }
+      await file.write(buffer, null, 'utf-8');
+    } finally {
+      await file.close();
     }
 
-    const violationsHtml = notFixed.map(v => {
-      const reason = v.autoFixable ? 'Fix failed or was skipped' : 'Requires manual review and context';
-      return `<div class="violation-item ${v.severity.toLowerCase()}">
-      const testLabel = v.isTestCode ? `<span class="test-code-label">🧪 Test Code (Not Auto-Fixed)</span>` : '';
-      const actualReason = v.isTestCode ? 'Test code is never auto-fixed' : reason;
-      
-          <div class="violation-header">
-              <span class="violation-rule">${v.rule}</span>
-              <div>
-                  <span class="violation-rule">${v.rule}</span>
-                  ${testLabel}
-              </div>
-          </div>
-          <div class="violation-details">
-              <p><strong>File:</strong> ${v.filePath}</p>
-              <p><strong>Location:</strong> <span class="violation-location">Line ${v.line}, Column ${v.column}</span></p>
-              <p><strong>Description:</strong> ${v.description}</p>
-          </div>
-          <div class="manual-action">
-              <strong>⚠ Reason:</strong> ${reason}<br>
-              <strong>⚠ Reason:</strong> ${actualReason}<br>
-          </div>
-      </div>`;
-    }).join('');
-
-    return `<div class="section">
-        <h2 class="section-title">⚠️ Not Auto-Fixable Issues (${notFixed.length})</h2>
-        <div class="violation-list">${violationsHtml}</div>
-    </div>`;
+    return reportPath;
   }
 
-  buildFileLevelSummary(scanResults, fixResults) {
-    const fileSummaries = {};
-
-    for (const [filePath, violations] of Object.entries(scanResults.fileViolations)) {
-      const fixed = fixResults.fixed.filter(f => f.violation.filePath === filePath).length;
-      fileSummaries[filePath] = {
-        total: violations.length,
-        fixed,
-        remaining: violations.length - fixed
-      };
-    }
-
-    const rows = Object.entries(fileSummaries).map(([filePath, summary]) => {
-      return `<tr>
-          <td>${filePath}</td>
-          <td style="text-align: center;">${summary.total}</td>
-          <td style="text-align: center; color: #00b894; font-weight: bold;">${summary.fixed}</td>
-          <td style="text-align: center; color: #ff7675; font-weight: bold;">${summary.remaining}</td>
-      </tr>`;
-    }).join('');
-
-    return `<div class="section">
-        <h2 class="section-title">📁 File-Level Summary</h2>
-        <table class="file-summary-table">
-            <thead>
-                <tr>
-                    <th>File</th>
-                    <th style="text-align: center;">Total Violations</th>
-                    <th style="text-align: center;">Fixed</th>
-                    <th style="text-align: center;">Remaining</th>
-                </tr>
-            </thead>
-            <tbody>${rows}</tbody>
-        </table>
-    </div>`;
+  /**
+   * Yields the report document in chunks (one per section / rule group)
+   */
+  *renderReportWithFixes(data) {
+    const { scanResults, prioritizedResults, fixResults, autoFixEnabled, originalResults } = data;
+    
+    const originalTotal = originalResults?.totalViolations || scanResults.totalViolations;
+    const fixedCount = fixResults?.fixed?.length || 0;
+    const remainingCount = scanResults.totalViolations;
+    const failedCount = fixResults?.failed?.length || 0;
+    
+    yield REPORT_HEAD;
+    yield this.buildHeader();
+    yield `
+        `;
+    yield this.buildRemediationSummary(originalTotal, fixedCount, remainingCount, failedCount, autoFixEnabled);
+    yield `
+        `;
+    yield* this.renderViolationsByTier(prioritizedResults, fixResults);
+    yield `
+        `;
+    yield this.buildFooter();
+    yield REPORT_TAIL;
   }
 
-  buildVerificationSection(verificationResults) {
-    if (!verificationResults || verificationResults.rollbacks.length === 0) {
-      return '';
-    }
-
-    return `<div class="section">
-        <h2 class="section-title">⚠️ Verification Issues</h2>
-        <p style="padding: 15px; background: #fff3cd; border-radius: 5px; color: #856404;">
-            Some fixes introduced new violations and were rolled back.
-        </p>
+  buildHeader() {
+    return `<div class="header">
+        <h1>🔍 Salesforce Security Review</h1>
+        <p>Static Analysis Report • Generated on ${new Date().toLocaleString()}</p>
     </div>`;
   }
 
@@ -679,7 +529,7 @@ export class HtmlReporter {
     </div>`;
   }
 
-  buildViolationsByTier(prioritizedResults, fixResults) {
+  *renderViolationsByTier(prioritizedResults, fixResults) {
     const fixedMap = new Map();
     const failedMap = new Map();
     
@@ -694,10 +544,8 @@ export class HtmlReporter {
       }
     }
     
-    let html = '';
-    
     if (prioritizedResults.tiers.TIER1_CRITICAL) {
-      html += this.buildTierSection(
+      yield* this.renderTierSection(
         'TIER1_CRITICAL',
         'Critical - Security & Data Access',
         '🚨',
@@ -709,7 +557,7 @@ export class HtmlReporter {
     }
     
     if (prioritizedResults.tiers.TIER2_IMPORTANT) {
-      html += this.buildTierSection(
+      yield* this.renderTierSection(
         'TIER2_IMPORTANT',
         'Important - Performance & Stability',
         '⚠️',
@@ -721,7 +569,7 @@ export class HtmlReporter {
     }
     
     if (prioritizedResults.tiers.TIER3_CLEANUP) {
-      html += this.buildTierSection(
+      yield* this.renderTierSection(
         'TIER3_CLEANUP',
         'Cleanup - Code Quality',
         '🧹',
@@ -731,28 +579,25 @@ export class HtmlReporter {
         'These are style and hygiene issues that can be safely auto-fixed.'
       );
     }
-    
-    return html;
   }
 
-  buildTierSection(tierKey, tierName, icon, tierData, fixedMap, failedMap, description) {
+  *renderTierSection(tierKey, tierName, icon, tierData, fixedMap, failedMap, description) {
     if (!tierData || !tierData.ruleGroups || Object.keys(tierData.ruleGroups).length === 0) {
-      return '';
+      return;
     }
     
     const tierClass = tierKey.toLowerCase().replace('_', '-');
     
-    let rulesHtml = '';
-    for (const [ruleName, ruleGroup] of Object.entries(tierData.ruleGroups)) {
-      rulesHtml += this.buildRuleGroup(ruleName, ruleGroup, fixedMap, failedMap, tierClass);
-    }
-    
-    return `<div class="section">
+    yield `<div class="section">
         <h2 class="section-title ${tierClass}">${icon} ${tierName}</h2>
         <div class="tier-explanation ${tierClass}">
             <p>${description}</p>
         </div>
-        ${rulesHtml}
+        `;
+    for (const [ruleName, ruleGroup] of Object.entries(tierData.ruleGroups)) {
+      yield this.buildRuleGroup(ruleName, ruleGroup, fixedMap, failedMap, tierClass);
+    }
+    yield `
     </div>`;
   }
 
@@ -775,20 +620,20 @@ export class HtmlReporter {
         const isFailed = failedMap.has(key);
         
         const statusLabel = isFixed 
+          ? `<span class="fixed-label">✅ Auto-Fixed: ${escapeHtml(fixedMap.get(key))}</span>`
           : isTest
           ? `<span class="fixed-label" style="background: #9c27b0;">🧪 Test Code (Not Auto-Fixed)</span>`
-          ? `<span class="fixed-label">✅ Auto-Fixed: ${fixedMap.get(key)}</span>`
           : isFailed
-          ? `<span class="fixed-label" style="background: #ff9800;">❌ ${failedMap.get(key)}</span>`
+          ? `<span class="fixed-label" style="background: #ff9800;">❌ ${escapeHtml(failedMap.get(key))}</span>`
           : `<span class="fixed-label" style="background: #f44336;">⚠️ Manual Fix Required</span>`;
         
         violationsHtml += `<div style="margin: 5px 0 5px 20px; font-size: 0.9em;">
-            Line ${violation.line}: ${violation.description} ${statusLabel}
+            Line ${violation.line}: ${escapeHtml(violation.description)} ${statusLabel}
         </div>`;
       }
       
       filesHtml += `<div class="file-summary-box">
-          <strong>📄 ${filePath}</strong> (${fileData.count} occurrence${fileData.count > 1 ? 's' : ''})
+          <strong>📄 ${escapeHtml(filePath)}</strong> (${fileData.count} occurrence${fileData.count > 1 ? 's' : ''})
           ${violationsHtml}
       </div>`;
       showCount++;
@@ -797,25 +642,13 @@ export class HtmlReporter {
     return `<div class="rule-block ${tierClass}">
         <div class="rule-header-row">
             <div>
-                <div class="rule-title">${ruleName}</div>
+                <div class="rule-title">${escapeHtml(ruleName)}</div>
                 <div class="rule-meta">${fileCount} file${fileCount > 1 ? 's' : ''} • ${totalOccurrences} occurrence${totalOccurrences > 1 ? 's' : ''}</div>
             </div>
         </div>
-        <div class="remediation-box">${ruleGroup.remediation || 'Review and fix according to Salesforce best practices.'}</div>
+        <div class="remediation-box">${escapeHtml(ruleGroup.remediation || 'Review and fix according to Salesforce best practices.')}</div>
         ${filesHtml}
         ${fileCount > maxShow ? `<div class="more-files">...and ${fileCount - maxShow} more file(s)</div>` : ''}
     </div>`;
   }
-
-  getRecommendedAction(rule) {
-    const actions = {
-      'ApexSOQLInjection': 'Use bind variables or String.escapeSingleQuotes() to prevent SOQL injection',
-      'CognitiveComplexity': 'Refactor method to reduce complexity by extracting helper methods',
-      'ApexCRUDViolation': 'Manually review and add appropriate CRUD/FLS checks based on business logic',
-      'ApexSharingViolation': 'Review class requirements and add appropriate sharing keyword'
-    };
-
-    return actions[rule] || 'Manually review and fix according to best practices';
-  }
 }
-
@@ -1,4 +1,4 @@
-import { readdir, readFile, stat } from 'fs/promises';
+import { readdir, readFile } from 'fs/promises';
 import { join, extname } from 'path';
 import { ApexCRUDViolationRule } from './rules/apexCRUDViolation.js';
 import { ApexSharingViolationRule } from './rules/apexSharingViolation.js';
@@ -6,11 +6,29 @@ import { AvoidDebugStatementsRule } from './rules/avoidDebugStatements.js';
 import { NoTrailingWhitespaceRule } from './rules/noTrailingWhitespace.js';
 import { ApexSOQLInjectionRule } from './rules/apexSOQLInjection.js';
 import { CognitiveComplexityRule } from './rules/cognitiveComplexity.js';
+import { LineIndex } from './lineIndex.js';
+import { PatternSet } from './patternSet.js';
+import { findPatternCandidates } from './ripgrepPrefilter.js';
+import { scanInWorkers, WORKER_BATCH_SIZE } from './workerPool.js';
+
+// Number of file reads kept in flight ahead of the file being scanned
+const READ_AHEAD = 8;
+
+// Dependency and build output directories never hold project sources
+const IGNORED_DIRECTORIES = new Set(['node_modules', 'target', 'build']);
+
+// @isTest / @IsTest annotation, with or without parameters
+const TEST_ANNOTATION_PATTERN = /@istest/i;
 
 export class ApexScanner {
   constructor(targetPath, options = {}) {
     this.targetPath = targetPath;
+    this.options = options;
     this.includeTestClasses = options.includeTestClasses !== undefined ? options.includeTestClasses : false;
+    this.workers = options.workers || 1;
+    this.fastPrefilter = options.fastPrefilter || false;
+    // Files that may match a rule pattern, or null to run the pattern pass on every file
+    this.patternCandidates = options.patternCandidates || null;
     this.rules = [
       new ApexCRUDViolationRule(),
       new ApexSharingViolationRule(),
@@ -19,6 +37,11 @@ export class ApexScanner {
       new ApexSOQLInjectionRule(),
       new CognitiveComplexityRule()
     ];
+    // Pattern-based rules are matched together in a single pass per file
+    this.patternSet = new PatternSet(this.rules);
+    // Pattern pass for files outside patternCandidates: rules with trigger
+    // tokens cannot match there, structural rules still run
+    this.structuralPatternSet = new PatternSet(this.rules.filter(rule => !rule.prefilterTokens));
   }
 
   /**
@@ -33,10 +56,10 @@ export class ApexScanner {
       return true;
     }
     
-    // Check if content contains @IsTest annotation
-    // Match @isTest or @IsTest with optional whitespace and parameters
-    const testAnnotationPattern = /@istest(\s*\(.*?\))?/i;
-    if (testAnnotationPattern.test(content)) {
+    // Check if content contains @IsTest annotation.
+    // Most files have no annotations at all, and a plain '@' search rejects
+    // them without running the case-insensitive pattern.
+    if (content.includes('@') && TEST_ANNOTATION_PATTERN.test(content)) {
       return true;
     }
     
@@ -46,27 +69,47 @@ export class ApexScanner {
   async scan() {
     const apexFiles = await this.findApexFiles(this.targetPath);
     const violations = [];
+
+    if (this.fastPrefilter) {
+      const tokens = this.rules.flatMap(rule => rule.prefilterTokens || []);
+      this.patternCandidates = await findPatternCandidates(this.targetPath, tokens);
+    }
     const fileViolations = {};
 
-    for (const filePath of apexFiles) {
-      const content = await readFile(filePath, 'utf-8');
-      
-      // Check if this is a test class
-      const isTest = this.isTestClass(filePath, content);
+    // Spreading files over worker threads only pays off once there are enough of them
+    const results = this.workers > 1 && apexFiles.length > WORKER_BATCH_SIZE
+      ? await scanInWorkers(apexFiles, {
+        workers: this.workers,
+        targetPath: this.targetPath,
+        options: { ...this.options, workers: 1, fastPrefilter: false, patternCandidates: this.patternCandidates }
+      })
+      : await this.scanPaths(apexFiles);
+
+    const violationsByRule = {};
+    const violationsBySeverity = {
+      Critical: [],
+      High: [],
+      Moderate: [],
+      Low: [],
+      Info: []
+    };
+
+    // Build the rule and severity indices while merging, in a single pass
+    apexFiles.forEach((filePath, i) => {
+      const fileViolationsList = results[i];
       
-      // Skip test classes if not configured to include them
-      if (isTest && !this.includeTestClasses) {
-        continue;
+      // Skipped test classes have no result
+      if (!fileViolationsList) {
+        return;
       }
       
-      const fileViolationsList = await this.scanFile(filePath, content);
-      
-      violations.push(...fileViolationsList);
       fileViolations[filePath] = fileViolationsList;
-    }
 
-    const violationsByRule = this.groupByRule(violations);
-    const violationsBySeverity = this.groupBySeverity(violations);
+      for (const violation of fileViolationsList) {
+        violations.push(violation);
+        this.indexViolation(violation, violationsByRule, violationsBySeverity);
+      }
+    });
 
     return {
       filesScanned: apexFiles.length,
@@ -79,12 +122,72 @@ export class ApexScanner {
     };
   }
 
+  /**
+   * Scans files in order while keeping a window of reads in flight,
+   * so disk I/O for upcoming files overlaps with scanning the current one.
+   */
+  async scanPaths(filePaths) {
+    const results = [];
+    const reads = [];
+    
+    const startRead = (index) => {
+      reads[index] = readFile(filePaths[index], 'utf-8').then(
+        content => ({ content }),
+        error => ({ error })
+      );
+    };
+    
+    for (let i = 0; i < Math.min(READ_AHEAD, filePaths.length); i++) {
+      startRead(i);
+    }
+    
+    for (let i = 0; i < filePaths.length; i++) {
+      const { content, error } = await reads[i];
+      reads[i] = null;
+      
+      if (i + READ_AHEAD < filePaths.length) {
+        startRead(i + READ_AHEAD);
+      }
+      if (error) {
+        throw error;
+      }
+      
+      results.push(await this.scanContent(filePaths[i], content));
+    }
+    
+    return results;
+  }
+
+  /**
+   * Scans a single file's content.
+   * Returns null when the file is a test class and test classes are excluded.
+   */
+  async scanContent(filePath, content) {
+    // Check if this is a test class
+    const isTest = this.isTestClass(filePath, content);
+    
+    // Skip test classes if not configured to include them
+    if (isTest && !this.includeTestClasses) {
+      return null;
+    }
+    
+    return this.scanFile(filePath, content);
+  }
+
   async scanFile(filePath, content) {
     const isTest = this.isTestClass(filePath, content);
     const violations = [];
+    // Newline offsets are computed once per file and shared by every rule
+    const lineIndex = new LineIndex(content);
+    const patternSet = !this.patternCandidates || this.patternCandidates.has(filePath)
+      ? this.patternSet
+      : this.structuralPatternSet;
+    const patternHits = this.matchPatterns(patternSet, filePath, content, lineIndex);
 
     for (const rule of this.rules) {
-      const ruleViolations = await rule.check(filePath, content);
+      const ruleViolations = this.patternSet.has(rule)
+        ? patternHits.get(rule) || []
+        : await rule.check(filePath, content, lineIndex);
       
       // Mark violations from test classes
       if (isTest) {
@@ -101,21 +204,52 @@ export class ApexScanner {
     return violations;
   }
 
+  /**
+   * Runs all pattern-based rules over the content in one pass.
+   * Returns a map of rule -> violations.
+   */
+  matchPatterns(patternSet, filePath, content, lineIndex) {
+    const hits = new Map();
+
+    for (const { rule, patternIndex, match } of patternSet.scan(content)) {
+      const violation = rule.checkMatch(filePath, match, lineIndex, patternIndex);
+      
+      if (violation) {
+        if (!hits.has(rule)) {
+          hits.set(rule, []);
+        }
+        hits.get(rule).push(violation);
+      }
+    }
+
+    return hits;
+  }
+
+  /**
+   * Recursively collects .cls files. Directory entries carry their type,
+   * so no extra stat calls are needed, and sibling directories are listed
+   * concurrently. Results keep directory listing order.
+   * Hidden directories (.git, .sfdx, ...) and ignored directories are pruned.
+   */
   async findApexFiles(dir) {
     const files = [];
     
     try {
       const entries = await readdir(dir, { withFileTypes: true });
       
-      for (const entry of entries) {
+      const nested = await Promise.all(entries.map(entry => {
         const fullPath = join(dir, entry.name);
         
         if (entry.isDirectory()) {
-          const subFiles = await this.findApexFiles(fullPath);
-          files.push(...subFiles);
+          return this.isIgnoredDirectory(entry.name) ? [] : this.findApexFiles(fullPath);
         } else if (entry.isFile() && extname(entry.name) === '.cls') {
-          files.push(fullPath);
+          return [fullPath];
         }
+        return [];
+      }));
+      
+      for (const subFiles of nested) {
+        files.push(...subFiles);
       }
     } catch (error) {
       console.warn(`Warning: Could not read directory ${dir}:`, error.message);
@@ -124,38 +258,22 @@ export class ApexScanner {
     return files;
   }
 
-  groupByRule(violations) {
-    const grouped = {};
-    
-    for (const violation of violations) {
-      if (!grouped[violation.rule]) {
-        grouped[violation.rule] = [];
-      }
-      grouped[violation.rule].push(violation);
-    }
-    
-    return grouped;
+  isIgnoredDirectory(name) {
+    return name.startsWith('.') || IGNORED_DIRECTORIES.has(name);
   }
 
-  groupBySeverity(violations) {
-    const grouped = {
-      Critical: [],
-      High: [],
-      Moderate: [],
-      Low: [],
-      Info: []
-    };
-    
-    for (const violation of violations) {
-      const severity = violation.severity || 'Info';
-      if (grouped[severity]) {
-        grouped[severity].push(violation);
-      } else {
-        grouped.Info.push(violation);
-      }
+  indexViolation(violation, byRule, bySeverity) {
+    if (!byRule[violation.rule]) {
+      byRule[violation.rule] = [];
+    }
+    byRule[violation.rule].push(violation);
+
+    const severity = violation.severity || 'Info';
+    if (bySeverity[severity]) {
+      bySeverity[severity].push(violation);
+    } else {
+      bySeverity.Info.push(violation);
     }
-    
-    return grouped;
   }
 }
 
@@ -0,0 +1,109 @@
+import {
+  NEWLINE,
+  QUOTE,
+  SLASH,
+  OPEN_BRACE,
+  CLOSE_BRACE,
+  skipLiteralOrComment
+} from './charCodes.js';
+
+/**
+ * Prefix sums of brace depth per line of a file's content.
+ * Built in one sweep over the file, so locating a method body is a pair of
+ * binary searches instead of a character scan from every method header.
+ * Braces inside string literals and comments are not counted; they are
+ * recognised with skipLiteralOrComment, as in CommentIndex.
+ */
+export class BraceIndex {
+  constructor(lineIndex) {
+    const content = lineIndex.content;
+    const length = content.length;
+    // lineDepth[n]: net '{' minus '}' from the start of the file through line n
+    this.lineDepth = new Int32Array(lineIndex.lineCount + 1);
+    // Lines containing at least one '{', ascending
+    this.openLines = [];
+    // Depth value -> lines ending at that depth, ascending
+    this.linesByDepth = new Map();
+
+    let depth = 0;
+    let lineNumber = 1;
+    let lineHasOpen = false;
+
+    for (let i = 0; i <= length; i++) {
+      const code = i < length ? content.charCodeAt(i) : NEWLINE;
+
+      if (code === NEWLINE) {
+        this.endLine(lineNumber++, depth, lineHasOpen);
+        lineHasOpen = false;
+      } else if (code === OPEN_BRACE) {
+        depth++;
+        lineHasOpen = true;
+      } else if (code === CLOSE_BRACE) {
+        depth--;
+      } else if (code === QUOTE || code === SLASH) {
+        const end = skipLiteralOrComment(content, i);
+        if (end !== -1) {
+          // Only block comments span lines; their lines end at the current depth
+          for (let j = i; j < end; j++) {
+            if (content.charCodeAt(j) === NEWLINE) {
+              this.endLine(lineNumber++, depth, lineHasOpen);
+              lineHasOpen = false;
+            }
+          }
+          i = end - 1;
+        }
+      }
+    }
+  }
+
+  endLine(lineNumber, depth, hasOpen) {
+    this.lineDepth[lineNumber] = depth;
+    if (hasOpen) {
+      this.openLines.push(lineNumber);
+    }
+
+    const lines = this.linesByDepth.get(depth);
+    if (lines) {
+      lines.push(lineNumber);
+    } else {
+      this.linesByDepth.set(depth, [lineNumber]);
+    }
+  }
+
+  /**
+   * Returns { startLine, endLine } for the body of the method declared on the
+   * given line: from the first line at or after it containing '{' to the first
+   * line ending with its braces balanced. endLine is null if they never balance,
+   * and null is returned if no '{' follows.
+   */
+  bodyLines(headerLine) {
+    const startLine = firstAtOrAfter(this.openLines, headerLine);
+    if (startLine === undefined) {
+      return null;
+    }
+
+    const balancedLines = this.linesByDepth.get(this.lineDepth[headerLine - 1]);
+    const endLine = balancedLines ? firstAtOrAfter(balancedLines, startLine) : undefined;
+
+    return { startLine, endLine: endLine === undefined ? null : endLine };
+  }
+}
+
+/**
+ * Returns the first value >= target in an ascending array, or undefined
+ */
+function firstAtOrAfter(values, target) {
+  let low = 0;
+  let high = values.length;
+
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (values[mid] < target) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+
+  return values[low];
+}
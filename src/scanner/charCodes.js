@@ -0,0 +1,74 @@
+export const NEWLINE = 10;
+export const QUOTE = 39;
+export const STAR = 42;
+export const SLASH = 47;
+export const BACKSLASH = 92;
+export const OPEN_BRACE = 123;
+export const CLOSE_BRACE = 125;
+
+/**
+ * Returns true for the characters matched by the regex \s class
+ */
+export function isWhitespace(code) {
+  if (code <= 32) {
+    return code === 32 || (code >= 9 && code <= 13);
+  }
+  if (code < 160) {
+    return false;
+  }
+  return code === 0xa0 || code === 0x1680 || (code >= 0x2000 && code <= 0x200a) ||
+    code === 0x2028 || code === 0x2029 || code === 0x202f || code === 0x205f ||
+    code === 0x3000 || code === 0xfeff;
+}
+
+/**
+ * Returns true for the characters the regex . does not match
+ */
+export function isLineTerminator(code) {
+  return code === 10 || code === 13 || code === 0x2028 || code === 0x2029;
+}
+
+/**
+ * Returns the end offset (exclusive) of the string literal or comment that
+ * starts at offset, or -1 if none starts there.
+ * Apex string literals are single-quoted and cannot span lines: a backslash
+ * escapes the next character, and a string left open ends before the newline.
+ * Line comments end before the newline, block comments after their '*' + '/'
+ * (both run to the end of the content when unterminated).
+ */
+export function skipLiteralOrComment(content, offset) {
+  const length = content.length;
+  const code = content.charCodeAt(offset);
+
+  if (code === QUOTE) {
+    let i = offset + 1;
+    while (i < length) {
+      const c = content.charCodeAt(i);
+      if (c === NEWLINE) {
+        return i;
+      }
+      i++;
+      if (c === QUOTE) {
+        return i;
+      }
+      if (c === BACKSLASH && content.charCodeAt(i) !== NEWLINE) {
+        i++;
+      }
+    }
+    return length;
+  }
+
+  if (code === SLASH) {
+    const next = content.charCodeAt(offset + 1);
+    if (next === SLASH) {
+      const end = content.indexOf('\n', offset + 2);
+      return end === -1 ? length : end;
+    }
+    if (next === STAR) {
+      const end = content.indexOf('*/', offset + 2);
+      return end === -1 ? length : end + 2;
+    }
+  }
+
+  return -1;
+}
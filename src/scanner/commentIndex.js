@@ -0,0 +1,75 @@
+import { QUOTE, SLASH, skipLiteralOrComment } from './charCodes.js';
+
+/**
+ * Sorted offset spans of the comments in a file's content.
+ * Built in one pass that skips string literals (see skipLiteralOrComment),
+ * so '//' inside a string is not a comment, and block comments spanning
+ * several lines are covered.
+ * Lookups are a binary search over the span starts.
+ */
+export class CommentIndex {
+  constructor(content) {
+    this.starts = [];
+    this.ends = [];
+
+    const length = content.length;
+    let i = 0;
+
+    while (i < length) {
+      const code = content.charCodeAt(i);
+
+      if (code === QUOTE || code === SLASH) {
+        const end = skipLiteralOrComment(content, i);
+        if (end !== -1) {
+          if (code === SLASH) {
+            this.add(i, end);
+          }
+          i = end;
+          continue;
+        }
+      }
+
+      i++;
+    }
+  }
+
+  add(start, end) {
+    this.starts.push(start);
+    this.ends.push(end);
+  }
+
+  /**
+   * Returns true if the offset lies inside a comment
+   */
+  contains(offset) {
+    const starts = this.starts;
+    let low = 0;
+    let high = starts.length - 1;
+
+    while (low <= high) {
+      const mid = (low + high) >>> 1;
+      if (starts[mid] <= offset) {
+        low = mid + 1;
+      } else {
+        high = mid - 1;
+      }
+    }
+
+    return high >= 0 && offset < this.ends[high];
+  }
+}
+
+// Comment spans per file, built on first use and shared by every rule
+const commentIndexes = new WeakMap();
+
+/**
+ * Returns the CommentIndex for a file's line index, building it once
+ */
+export function getCommentIndex(lineIndex) {
+  let comments = commentIndexes.get(lineIndex);
+  if (!comments) {
+    comments = new CommentIndex(lineIndex.content);
+    commentIndexes.set(lineIndex, comments);
+  }
+  return comments;
+}
@@ -0,0 +1,78 @@
+/**
+ * Newline offset table for a file's content.
+ * Lets rules run a pattern once over the whole file and map match
+ * offsets back to 1-based line/column positions via binary search.
+ */
+export class LineIndex {
+  constructor(content) {
+    this.content = content;
+    this.lineStarts = [0];
+    // 0-based index of the line found by the previous lineOf() call
+    this.lastLine = 0;
+
+    let pos = content.indexOf('\n');
+    while (pos !== -1) {
+      this.lineStarts.push(pos + 1);
+      pos = content.indexOf('\n', pos + 1);
+    }
+  }
+
+  get lineCount() {
+    return this.lineStarts.length;
+  }
+
+  /**
+   * Returns the 1-based line number containing the given offset.
+   * Rules look up match offsets in increasing order, so the search starts
+   * from the previous result when the offset lies at or after it.
+   */
+  lineOf(offset) {
+    const starts = this.lineStarts;
+    let low = 0;
+    let high = starts.length - 1;
+
+    if (starts[this.lastLine] <= offset) {
+      low = this.lastLine;
+      // Usually the same or the next line: skip the search entirely
+      if (low === high || offset < starts[low + 1]) {
+        return low + 1;
+      }
+    }
+
+    while (low < high) {
+      const mid = (low + high + 1) >>> 1;
+      if (starts[mid] <= offset) {
+        low = mid;
+      } else {
+        high = mid - 1;
+      }
+    }
+
+    this.lastLine = low;
+    return low + 1;
+  }
+
+  /**
+   * Returns the 1-based column of the given offset within its line
+   */
+  columnOf(offset) {
+    return offset - this.lineStarts[this.lineOf(offset) - 1] + 1;
+  }
+
+  lineStart(lineNumber) {
+    return this.lineStarts[lineNumber - 1];
+  }
+
+  /**
+   * Returns the offset of the newline ending the line (or content length)
+   */
+  lineEnd(lineNumber) {
+    return lineNumber < this.lineStarts.length
+      ? this.lineStarts[lineNumber] - 1
+      : this.content.length;
+  }
+
+  getLine(lineNumber) {
+    return this.content.slice(this.lineStart(lineNumber), this.lineEnd(lineNumber));
+  }
+}
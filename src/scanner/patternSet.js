@@ -0,0 +1,107 @@
+/**
+ * Multi-pattern matcher for rule patterns.
+ * Composes every rule pattern into one alternation so a file is traversed
+ * once for all pattern-based rules, instead of once per rule. Each match is
+ * dispatched back to the owning rule by pattern id.
+ *
+ * Rule patterns are expected not to overlap each other: at any position the
+ * first alternative that matches wins. Capturing groups inside rule patterns
+ * are rewritten as non-capturing, leaving exactly one capturing group per
+ * pattern, so pattern id N is capture group N + 1. Rules re-derive any details
+ * they need from the matched line.
+ *
+ * Dispatch reads the owning rule and pattern index from parallel arrays by id.
+ */
+export class PatternSet {
+  constructor(rules, flags = 'gim') {
+    this.entryRules = [];
+    this.entryPatternIndexes = [];
+    this.rules = new Set();
+    const sources = [];
+
+    for (const rule of rules) {
+      if (!rule.patterns || !rule.patterns.every(pattern => pattern.flags === flags)) {
+        continue;
+      }
+
+      rule.patterns.forEach((pattern, patternIndex) => {
+        this.entryRules.push(rule);
+        this.entryPatternIndexes.push(patternIndex);
+        sources.push(`(${toNonCapturing(pattern.source)})`);
+      });
+      this.rules.add(rule);
+    }
+
+    // Sources are composed (and validated) up front; the RegExp itself is only
+    // built by the first scan, so a scanner that hands all files to workers
+    // never constructs it
+    this.source = sources.join('|');
+    this.flags = flags;
+    this.compiled = null;
+  }
+
+  get regex() {
+    if (this.compiled === null && this.entryRules.length > 0) {
+      this.compiled = new RegExp(this.source, this.flags);
+    }
+    return this.compiled;
+  }
+
+  has(rule) {
+    return this.rules.has(rule);
+  }
+
+  /**
+   * Yields { rule, patternIndex, match } for every match in the content
+   */
+  *scan(content) {
+    const regex = this.regex;
+    if (!regex) {
+      return;
+    }
+
+    const count = this.entryRules.length;
+
+    for (const match of content.matchAll(regex)) {
+      for (let id = 0; id < count; id++) {
+        if (match[id + 1] !== undefined) {
+          yield { rule: this.entryRules[id], patternIndex: this.entryPatternIndexes[id], match };
+          break;
+        }
+      }
+    }
+  }
+}
+
+/**
+ * Rewrites capturing groups in a pattern source as non-capturing groups.
+ * Backreferences and named groups cannot survive composition and are rejected.
+ */
+export function toNonCapturing(source) {
+  if (/\\(?:[1-9]|k<)|\(\?<(?![=!])/.test(source)) {
+    throw new Error(`Pattern cannot be composed (backreference or named group): /${source}/`);
+  }
+
+  let result = '';
+  let inClass = false;
+
+  for (let i = 0; i < source.length; i++) {
+    const char = source[i];
+
+    if (char === '\\') {
+      result += char + source[++i];
+    } else if (inClass) {
+      inClass = char !== ']';
+      result += char;
+    } else if (char === '[') {
+      inClass = true;
+      result += char;
+    } else if (char === '(' && source[i + 1] !== '?') {
+      result += '(?:';
+    } else {
+      result += char;
+    }
+  }
+
+  return result;
+}
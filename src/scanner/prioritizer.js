@@ -10,6 +10,17 @@
  * - Tier 3 (CLEANUP): Style & hygiene - Auto-Fixable
  */
 
+// Remediation guidance per rule, attached to every rule group
+const REMEDIATION_GUIDANCE = {
+  'ApexCRUDViolation': 'SOQL: Add WITH SECURITY_ENFORCED. DML: Add Schema.sObjectType.isCreateable/isUpdateable/isDeletable checks.',
+  'ApexSOQLInjection': 'Use bind variables or String.escapeSingleQuotes() to prevent SOQL injection attacks.',
+  'ApexSharingViolation': 'Add "with sharing" to class declaration to enforce user-level security.',
+  'CognitiveComplexity': 'Refactor complex methods by extracting helper methods and reducing nested logic.',
+  'NoTrailingWhitespace': 'Remove trailing whitespace characters from lines.',
+  'AvoidDebugStatements': 'Remove System.debug() statements before deploying to production.'
+};
+const DEFAULT_REMEDIATION = 'Review and fix according to Salesforce best practices.';
+
 export class Prioritizer {
   constructor() {
     // Tier definitions with business context
@@ -263,17 +274,8 @@ export class Prioritizer {
    * Add remediation guidance for each rule
    */
   addRemediationGuidance(ruleGroups) {
-    const guidance = {
-      'ApexCRUDViolation': 'SOQL: Add WITH SECURITY_ENFORCED. DML: Add Schema.sObjectType.isCreateable/isUpdateable/isDeletable checks.',
-      'ApexSOQLInjection': 'Use bind variables or String.escapeSingleQuotes() to prevent SOQL injection attacks.',
-      'ApexSharingViolation': 'Add "with sharing" to class declaration to enforce user-level security.',
-      'CognitiveComplexity': 'Refactor complex methods by extracting helper methods and reducing nested logic.',
-      'NoTrailingWhitespace': 'Remove trailing whitespace characters from lines.',
-      'AvoidDebugStatements': 'Remove System.debug() statements before deploying to production.'
-    };
-
     for (const [rule, group] of Object.entries(ruleGroups)) {
-      group.remediation = guidance[rule] || 'Review and fix according to Salesforce best practices.';
+      group.remediation = REMEDIATION_GUIDANCE[rule] || DEFAULT_REMEDIATION;
     }
 
     return ruleGroups;
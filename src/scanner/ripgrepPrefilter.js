@@ -0,0 +1,60 @@
+import { execFile } from 'child_process';
+import { normalize } from 'path';
+
+// rg exits with 1 when no file matched, which is not a failure
+const RG_NO_MATCH_EXIT_CODE = 1;
+const RG_MAX_BUFFER = 64 * 1024 * 1024;
+
+/**
+ * Optional pre-filter backed by ripgrep (`rg`), used with --fast-prefilter.
+ * Lists the .cls files under targetPath that contain at least one of the
+ * trigger tokens (System.debug, DML keywords, [SELECT, Database.query...)
+ * declared by rules as `prefilterTokens`. Files without any can skip those
+ * rules; structural rules (sharing, complexity, whitespace) run on every file.
+ *
+ * Tokens are searched as case-insensitive fixed strings. Every match of a
+ * rule's pattern contains one of its tokens, and rg's Unicode case folding
+ * only widens the match, so the candidate set is a superset of the files
+ * the rule patterns would match. The JS pattern sources are not reused:
+ * rg's regex engine treats \b and \s differently.
+ *
+ * Resolves to a Set of normalized file paths, or null when rg is not
+ * installed or fails; callers then run every rule on every file.
+ */
+export function findPatternCandidates(targetPath, tokens) {
+  if (tokens.length === 0) {
+    return Promise.resolve(null);
+  }
+
+  const args = [
+    '--files-with-matches',
+    '--null',
+    '--fixed-strings',
+    '--ignore-case',
+    '--no-ignore',
+    '--hidden',
+    '--no-messages',
+    '--glob', '*.cls'
+  ];
+  for (const token of tokens) {
+    args.push('--regexp', token);
+  }
+  args.push('--', targetPath);
+
+  return new Promise(resolve => {
+    execFile('rg', args, { maxBuffer: RG_MAX_BUFFER }, (error, stdout) => {
+      if (error && error.code !== RG_NO_MATCH_EXIT_CODE) {
+        resolve(null);
+        return;
+      }
+
+      const candidates = new Set();
+      for (const filePath of stdout.split('\0')) {
+        if (filePath) {
+          candidates.add(normalize(filePath));
+        }
+      }
+      resolve(candidates);
+    });
+  });
+}
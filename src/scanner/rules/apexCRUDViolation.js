@@ -1,86 +1,120 @@
+import { LineIndex } from '../lineIndex.js';
+import { createViolation } from '../violation.js';
+
+const DML_PATTERNS = [
+  { pattern: /\b(insert|update|delete|upsert)[^\S\n]+/gim, operation: 'DML' },
+  { pattern: /\[SELECT[^\S\n]+/gim, operation: 'SOQL' }
+];
+
+// Security checks that suppress a finding within SECURITY_CHECK_RANGE lines.
+// The Schema.sObjectType...isXxx() forms are covered by the bare method patterns.
+const SECURITY_CHECK_PATTERNS = [
+  /WITH[^\S\n]+SECURITY_ENFORCED/gi,
+  /is(?:Accessible|Createable|Updateable|Deletable)\(\)/g
+];
+const SECURITY_CHECK_RANGE = 10;
+
+// Sorted security-check line numbers per file, built on the first match
+const securityCheckLines = new WeakMap();
+
+const SOBJECT_PATTERN = /\b(insert|update|delete|upsert)\s+(\w+)/i;
+
 export class ApexCRUDViolationRule {
   constructor() {
     this.name = 'ApexCRUDViolation';
     this.severity = 'Critical';
     this.autoFixable = true;
     this.description = 'DML operation without CRUD/FLS security check';
+    this.patterns = DML_PATTERNS.map(({ pattern }) => pattern);
+    this.prefilterTokens = ['insert', 'update', 'delete', 'upsert', '[SELECT'];
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
-    
-    const dmlPatterns = [
-      { pattern: /\b(insert|update|delete|upsert)\s+/gi, operation: 'DML' },
-      { pattern: /\[SELECT\s+/gi, operation: 'SOQL' }
-    ];
-
-    const securityCheckPatterns = [
-      /WITH\s+SECURITY_ENFORCED/i,
-      /Schema\.sObjectType\.\w+\.fields\.\w+\.isAccessible\(\)/,
-      /Schema\.sObjectType\.\w+\.fields\.\w+\.isCreateable\(\)/,
-      /Schema\.sObjectType\.\w+\.fields\.\w+\.isUpdateable\(\)/,
-      /Schema\.sObjectType\.\w+\.isDeletable\(\)/,
-      /isAccessible\(\)/,
-      /isCreateable\(\)/,
-      /isUpdateable\(\)/,
-      /isDeletable\(\)/
-    ];
-
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
-      
-      for (const { pattern, operation } of dmlPatterns) {
-        const matches = line.matchAll(pattern);
-        
-        for (const match of matches) {
-          const hasSecurityCheck = this.hasSecurityCheckNearby(lines, i, securityCheckPatterns);
-          
-          if (!hasSecurityCheck) {
-            const sobject = this.extractSObject(line);
-            const specificOp = operation === 'DML' ? this.detectDMLOperation(line) : operation;
-            
-            violations.push({
-              rule: this.name,
-              severity: this.severity,
-              filePath,
-              line: lineNumber,
-              column: match.index + 1,
-              description: `${specificOp} operation without CRUD/FLS check`,
-              autoFixable: operation === 'SOQL' || (this.autoFixable && sobject !== null),
-              context: {
-                operation: specificOp,
-                sobject,
-                lineContent: line.trim()
-              }
-            });
-          }
+
+    DML_PATTERNS.forEach(({ pattern }, patternIndex) => {
+      for (const match of content.matchAll(pattern)) {
+        const violation = this.checkMatch(filePath, match, lineIndex, patternIndex);
+        if (violation) {
+          violations.push(violation);
         }
       }
-    }
+    });
 
-    return violations;
+    // Keep per-line ordering stable: DML findings before SOQL findings on the same line
+    return violations.sort((a, b) => a.line - b.line);
   }
 
-  hasSecurityCheckNearby(lines, currentIndex, patterns, range = 10) {
-    const start = Math.max(0, currentIndex - range);
-    const end = Math.min(lines.length, currentIndex + range);
+  checkMatch(filePath, match, lineIndex, patternIndex) {
+    const { operation } = DML_PATTERNS[patternIndex];
+    const lineNumber = lineIndex.lineOf(match.index);
+    
+    if (this.hasSecurityCheckNearby(lineIndex, lineNumber)) {
+      return null;
+    }
+
+    const line = lineIndex.getLine(lineNumber);
+    const sobject = this.extractSObject(line);
+    const specificOp = operation === 'DML' ? this.detectDMLOperation(line) : operation;
     
-    for (let i = start; i < end; i++) {
-      const line = lines[i];
-      for (const pattern of patterns) {
-        if (pattern.test(line)) {
-          return true;
+    return createViolation(
+      this,
+      filePath,
+      lineNumber,
+      match.index - lineIndex.lineStart(lineNumber) + 1,
+      `${specificOp} operation without CRUD/FLS check`,
+      {
+        operation: specificOp,
+        sobject,
+        lineContent: line.trim()
+      },
+      operation === 'SOQL' || (this.autoFixable && sobject !== null)
+    );
+  }
+
+  /**
+   * Checks for a security check from `range` lines before the given line
+   * through `range - 1` lines after it
+   */
+  hasSecurityCheckNearby(lineIndex, lineNumber, range = SECURITY_CHECK_RANGE) {
+    const checkLines = this.getSecurityCheckLines(lineIndex);
+    const first = Math.max(1, lineNumber - range);
+    const last = Math.min(lineIndex.lineCount, lineNumber + range - 1);
+
+    // Binary search for the first check line at or after `first`
+    let low = 0;
+    let high = checkLines.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (checkLines[mid] < first) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+
+    return low < checkLines.length && checkLines[low] <= last;
+  }
+
+  getSecurityCheckLines(lineIndex) {
+    let checkLines = securityCheckLines.get(lineIndex);
+
+    if (!checkLines) {
+      const lineSet = new Set();
+      for (const pattern of SECURITY_CHECK_PATTERNS) {
+        for (const match of lineIndex.content.matchAll(pattern)) {
+          lineSet.add(lineIndex.lineOf(match.index));
         }
       }
+      checkLines = [...lineSet].sort((a, b) => a - b);
+      securityCheckLines.set(lineIndex, checkLines);
     }
-    
-    return false;
+
+    return checkLines;
   }
 
   extractSObject(line) {
-    const match = line.match(/\b(insert|update|delete|upsert)\s+(\w+)/i);
+    const match = line.match(SOBJECT_PATTERN);
     return match ? match[2] : null;
   }
 
@@ -92,4 +126,3 @@ export class ApexCRUDViolationRule {
     return 'DML';
   }
 }
-
@@ -1,55 +1,59 @@
+import { LineIndex } from '../lineIndex.js';
+import { createViolation } from '../violation.js';
+
+const SOQL_PATTERN = /Database\.(query|countQuery|getQueryLocator)[^\S\n]*\(/gim;
+const STRING_CONCAT_PATTERN = /['"]\s*\+|\+\s*['"]/;
+
 export class ApexSOQLInjectionRule {
   constructor() {
     this.name = 'ApexSOQLInjection';
     this.severity = 'Critical';
     this.autoFixable = false;
     this.description = 'Potential SOQL injection vulnerability';
+    this.patterns = [SOQL_PATTERN];
+    this.prefilterTokens = ['Database.query', 'Database.countQuery', 'Database.getQueryLocator'];
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
-    
-    const soqlPattern = /Database\.(query|countQuery|getQueryLocator)\s*\(/gi;
-    const stringConcatPattern = /[\+]\s*['"]/;
     
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
-      
-      const matches = line.matchAll(soqlPattern);
-      
-      for (const match of matches) {
-        const statementLines = this.getStatementLines(lines, i);
-        const fullStatement = statementLines.join(' ');
-        
-        if (this.hasPotentialInjection(fullStatement)) {
-          violations.push({
-            rule: this.name,
-            severity: this.severity,
-            filePath,
-            line: lineNumber,
-            column: match.index + 1,
-            description: 'Dynamic SOQL with string concatenation detected - potential injection risk',
-            autoFixable: this.autoFixable,
-            context: {
-              lineContent: line.trim()
-            }
-          });
-        }
+    for (const match of content.matchAll(SOQL_PATTERN)) {
+      const violation = this.checkMatch(filePath, match, lineIndex);
+      if (violation) {
+        violations.push(violation);
       }
     }
 
     return violations;
   }
 
+  checkMatch(filePath, match, lineIndex) {
+    const lineNumber = lineIndex.lineOf(match.index);
+    const statementLines = this.getStatementLines(lineIndex, lineNumber);
+    const fullStatement = statementLines.join(' ');
+    
+    if (!this.hasPotentialInjection(fullStatement)) {
+      return null;
+    }
+
+    return createViolation(
+      this,
+      filePath,
+      lineNumber,
+      match.index - lineIndex.lineStart(lineNumber) + 1,
+      'Dynamic SOQL with string concatenation detected - potential injection risk',
+      {
+        lineContent: lineIndex.getLine(lineNumber).trim()
+      }
+    );
+  }
+
   hasPotentialInjection(statement) {
-    return statement.includes('+') && /['"]\s*\+|\+\s*['"]/.test(statement);
+    return statement.includes('+') && STRING_CONCAT_PATTERN.test(statement);
   }
 
-  getStatementLines(lines, startIndex) {
-    const result = [lines[startIndex]];
+  getStatementLines(lineIndex, lineNumber) {
+    const result = [lineIndex.getLine(lineNumber)];
     return result;
   }
 }
-
@@ -1,56 +1,74 @@
+import { LineIndex } from '../lineIndex.js';
+import { createViolation } from '../violation.js';
+
+// Apex keywords are case-insensitive
+const CLASS_PATTERN = /^[^\S\n]*(public|global)[^\S\n]+(abstract[^\S\n]+)?(class|interface)[^\S\n]+(\w+)/gim;
+const CLASS_DECLARATION_PATTERN = /^\s*(public|global)\s+(abstract\s+)?(class|interface)\s+(\w+)/i;
+const SHARING_KEYWORD_PATTERN = /\b(with sharing|without sharing|inherited sharing)\b/i;
+
 export class ApexSharingViolationRule {
   constructor() {
     this.name = 'ApexSharingViolation';
     this.severity = 'High';
     this.autoFixable = true;
     this.description = 'Class without sharing declaration';
+    this.patterns = [CLASS_PATTERN];
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
     
-    const classPattern = /^\s*(public|global)\s+(abstract\s+)?(class|interface)\s+(\w+)/;
-    
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
-      const match = line.match(classPattern);
-      
-      if (match) {
-        const className = match[4];
-        const hasSharingKeyword = this.hasSharingKeyword(lines, i);
-        
-        if (!hasSharingKeyword) {
-          violations.push({
-            rule: this.name,
-            severity: this.severity,
-            filePath,
-            line: lineNumber,
-            column: match.index + 1,
-            description: `Class '${className}' missing sharing declaration`,
-            autoFixable: this.autoFixable,
-            context: {
-              className,
-              lineContent: line.trim()
-            }
-          });
-        }
+    for (const match of content.matchAll(CLASS_PATTERN)) {
+      const violation = this.checkMatch(filePath, match, lineIndex);
+      if (violation) {
+        violations.push(violation);
       }
     }
 
     return violations;
   }
 
-  hasSharingKeyword(lines, classLineIndex) {
-    const checkRange = Math.max(0, classLineIndex - 3);
+  checkMatch(filePath, match, lineIndex) {
+    const lineNumber = lineIndex.lineOf(match.index);
+    const lineStart = lineIndex.lineStart(lineNumber);
     
-    for (let i = checkRange; i <= classLineIndex; i++) {
-      if (/\b(with sharing|without sharing|inherited sharing)\b/.test(lines[i])) {
-        return true;
-      }
+    // With the 'm' flag, '^' also matches after a lone '\r' or U+2028/U+2029;
+    // only declarations at the start of a '\n'-separated line count
+    if (match.index !== lineStart) {
+      return null;
+    }
+    
+    const line = lineIndex.getLine(lineNumber);
+    const declaration = line.match(CLASS_DECLARATION_PATTERN);
+    
+    if (!declaration || this.hasSharingKeyword(lineIndex, lineNumber - 1)) {
+      return null;
     }
-    return false;
+
+    const className = declaration[4];
+    
+    return createViolation(
+      this,
+      filePath,
+      lineNumber,
+      match.index - lineStart + 1,
+      `Class '${className}' missing sharing declaration`,
+      {
+        className,
+        lineContent: line.trim()
+      }
+    );
   }
-}
 
+  hasSharingKeyword(lineIndex, classLineIndex) {
+    // One test over the class line and the three lines before it, sliced as a
+    // single span; a keyword cannot span lines, so this matches a per-line check
+    const firstLine = Math.max(0, classLineIndex - 3) + 1;
+    const span = lineIndex.content.slice(
+      lineIndex.lineStart(firstLine),
+      lineIndex.lineEnd(classLineIndex + 1)
+    );
+    
+    return SHARING_KEYWORD_PATTERN.test(span);
+  }
+}
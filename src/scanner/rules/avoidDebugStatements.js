@@ -1,47 +1,54 @@
+import { LineIndex } from '../lineIndex.js';
+import { getCommentIndex } from '../commentIndex.js';
+import { createViolation } from '../violation.js';
+
+const DEBUG_PATTERN = /System\.debug[^\S\n]*\(/gim;
+
 export class AvoidDebugStatementsRule {
   constructor() {
     this.name = 'AvoidDebugStatements';
     this.severity = 'Low';
     this.autoFixable = true;
     this.description = 'System.debug() statements should be removed in production code';
+    this.patterns = [DEBUG_PATTERN];
+    this.prefilterTokens = ['System.debug'];
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
-    
-    const debugPattern = /System\.debug\s*\(/gi;
     
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
-      
-      const matches = line.matchAll(debugPattern);
-      
-      for (const match of matches) {
-        if (!this.isCommented(line, match.index)) {
-          violations.push({
-            rule: this.name,
-            severity: this.severity,
-            filePath,
-            line: lineNumber,
-            column: match.index + 1,
-            description: 'System.debug() statement found',
-            autoFixable: this.autoFixable,
-            context: {
-              lineContent: line.trim()
-            }
-          });
-        }
+    for (const match of content.matchAll(DEBUG_PATTERN)) {
+      const violation = this.checkMatch(filePath, match, lineIndex);
+      if (violation) {
+        violations.push(violation);
       }
     }
 
     return violations;
   }
 
-  isCommented(line, index) {
-    const beforeMatch = line.substring(0, index);
-    return beforeMatch.includes('//');
+  checkMatch(filePath, match, lineIndex) {
+    const lineNumber = lineIndex.lineOf(match.index);
+    const line = lineIndex.getLine(lineNumber);
+    const column = match.index - lineIndex.lineStart(lineNumber);
+    
+    if (this.isCommented(lineIndex, match.index)) {
+      return null;
+    }
+
+    return createViolation(
+      this,
+      filePath,
+      lineNumber,
+      column + 1,
+      'System.debug() statement found',
+      {
+        lineContent: line.trim()
+      }
+    );
+  }
+
+  isCommented(lineIndex, offset) {
+    return getCommentIndex(lineIndex).contains(offset);
   }
 }
-
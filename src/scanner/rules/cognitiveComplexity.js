@@ -1,3 +1,33 @@
+import { LineIndex } from '../lineIndex.js';
+import { BraceIndex } from '../braceIndex.js';
+import { getCommentIndex } from '../commentIndex.js';
+import { createViolation } from '../violation.js';
+import { LruCache } from '../../lruCache.js';
+import { isWhitespace, isLineTerminator } from '../charCodes.js';
+
+// Brace depth per line, built on the first method candidate in a file
+const braceIndexes = new WeakMap();
+
+// Complexity per method body text, least recently used evicted first.
+// Identical bodies (shared helpers, rescans in one process) are scored once.
+const complexityCache = new LruCache(1024);
+
+// Matched in place at a line's start offset (sticky), so the line is never
+// copied out; whitespace stops at the newline as it would on a split line.
+const METHOD_PATTERN = /[^\S\n]*(public|private|protected|global)[^\S\n]+(static[^\S\n]+)?(\w+)[^\S\n]+(\w+)[^\S\n]*\(/y;
+// Method header candidates for the combined pattern pass: only the access
+// modifier prefix is consumed, so no text other rules could match is taken.
+// Composed patterns share the 'i' flag; candidates are confirmed with the
+// case-sensitive METHOD_PATTERN.
+const METHOD_HEADER_PATTERN = /^[^\S\n]*(public|private|protected|global)[^\S\n]/gim;
+
+// Control-flow keywords in one alternation, each match adding one to a method's
+// complexity. The else-if alternative stops before 'if', so 'else if (' adds two
+// (as an else-if and as an if). Matches are only counted, via test(), which does
+// not build a match array.
+const CONTROL_FLOW_PATTERN = /\b(?:if\s*\(|else\s+(?=if\b)|for\s*\(|while\s*\(|catch\s*\()/g;
+const COLON = 58;
+
 export class CognitiveComplexityRule {
   constructor() {
     this.name = 'CognitiveComplexity';
@@ -5,87 +35,163 @@ export class CognitiveComplexityRule {
     this.autoFixable = false;
     this.threshold = 15;
     this.description = 'Method has high cognitive complexity';
+    this.patterns = [METHOD_HEADER_PATTERN];
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
-    
-    const methodPattern = /^\s*(public|private|protected|global)\s+(static\s+)?(\w+)\s+(\w+)\s*\(/;
     
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
-      const match = line.match(methodPattern);
-      
-      if (match) {
-        const methodName = match[4];
-        const methodBody = this.extractMethodBody(lines, i);
-        const complexity = this.calculateComplexity(methodBody);
-        
-        if (complexity > this.threshold) {
-          violations.push({
-            rule: this.name,
-            severity: this.severity,
-            filePath,
-            line: lineNumber,
-            column: match.index + 1,
-            description: `Method '${methodName}' has cognitive complexity of ${complexity} (threshold: ${this.threshold})`,
-            autoFixable: this.autoFixable,
-            context: {
-              methodName,
-              complexity,
-              threshold: this.threshold
-            }
-          });
-        }
+    for (const match of content.matchAll(METHOD_HEADER_PATTERN)) {
+      const violation = this.checkMatch(filePath, match, lineIndex);
+      if (violation) {
+        violations.push(violation);
       }
     }
 
     return violations;
   }
 
-  extractMethodBody(lines, startIndex) {
-    const body = [];
-    let braceCount = 0;
-    let started = false;
+  checkMatch(filePath, headerMatch, lineIndex) {
+    const lineNumber = lineIndex.lineOf(headerMatch.index);
+    const lineStart = lineIndex.lineStart(lineNumber);
     
-    for (let i = startIndex; i < lines.length; i++) {
-      const line = lines[i];
-      
-      for (const char of line) {
-        if (char === '{') {
-          braceCount++;
-          started = true;
-        } else if (char === '}') {
-          braceCount--;
-        }
-      }
-      
-      if (started) {
-        body.push(line);
-      }
-      
-      if (started && braceCount === 0) {
-        break;
+    // '^' also matches after a lone '\r' or U+2028/U+2029; a line's signature
+    // is only checked from its own start, so later candidates would duplicate it
+    if (headerMatch.index !== lineStart) {
+      return null;
+    }
+    
+    // Commented-out methods have no body: the brace index skips their braces
+    if (getCommentIndex(lineIndex).contains(lineStart)) {
+      return null;
+    }
+    
+    METHOD_PATTERN.lastIndex = lineStart;
+    const match = METHOD_PATTERN.exec(lineIndex.content);
+    
+    if (!match) {
+      return null;
+    }
+
+    const methodName = match[4];
+    const methodBody = this.extractMethodBody(lineIndex, lineNumber);
+    const complexity = this.calculateComplexity(methodBody);
+    
+    if (complexity <= this.threshold) {
+      return null;
+    }
+
+    return createViolation(
+      this,
+      filePath,
+      lineNumber,
+      match.index - lineStart + 1,
+      `Method '${methodName}' has cognitive complexity of ${complexity} (threshold: ${this.threshold})`,
+      {
+        methodName,
+        complexity,
+        threshold: this.threshold
       }
+    );
+  }
+
+  /**
+   * Returns the lines from the method's opening brace through the line
+   * where its braces balance, sliced directly out of the file content.
+   * Line bounds come from the file's brace index, built once per file.
+   */
+  extractMethodBody(lineIndex, startLine) {
+    let braceIndex = braceIndexes.get(lineIndex);
+    if (!braceIndex) {
+      braceIndex = new BraceIndex(lineIndex);
+      braceIndexes.set(lineIndex, braceIndex);
+    }
+    
+    const body = braceIndex.bodyLines(startLine);
+    if (!body) {
+      return '';
     }
     
-    return body.join('\n');
+    const bodyEnd = body.endLine === null ? lineIndex.content.length : lineIndex.lineEnd(body.endLine);
+    return lineIndex.content.slice(lineIndex.lineStart(body.startLine), bodyEnd);
   }
 
   calculateComplexity(methodBody) {
-    const complexityPatterns = [/\bif\s*\(/, /\belse\s+if\b/, /\bfor\s*\(/, /\bwhile\s*\(/, /\bcatch\s*\(/, /\?\s*.*\s*:/];
-    let complexity = 0;
+    let complexity = complexityCache.get(methodBody);
     
-    for (const pattern of complexityPatterns) {
-      const matches = methodBody.match(new RegExp(pattern.source, 'g'));
-      if (matches) {
-        complexity += matches.length;
-      }
+    if (complexity === undefined) {
+      complexity = this.scoreComplexity(methodBody);
+      complexityCache.set(methodBody, complexity);
     }
     
     return complexity;
   }
+
+  scoreComplexity(methodBody) {
+    let complexity = 0;
+    
+    CONTROL_FLOW_PATTERN.lastIndex = 0;
+    while (CONTROL_FLOW_PATTERN.test(methodBody)) {
+      complexity++;
+    }
+    
+    return complexity + countTernaries(methodBody);
+  }
+}
+
+/**
+ * Counts the matches of /\?\s*.*\s*:/g without running the regex, whose
+ * greedy '.*' rescans the rest of the line from every '?'.
+ *
+ * From a '?', the regex skips whitespace (newlines included) to the first
+ * operand, and matches up to either a ':' that follows the rest of that line
+ * and any whitespace after it, or failing that the last ':' on the line.
+ * Those two positions are computed once per line and shared by every '?'
+ * whose operand starts on it.
+ */
+function countTernaries(text) {
+  const length = text.length;
+  let count = 0;
+  // Line holding the last operand start: its end, its last ':' and the ':'
+  // reached across the whitespace after it (-1 when there is none)
+  let lineEnd = -1;
+  let lineColon = -1;
+  let nextLineColon = -1;
+  let question = text.indexOf('?');
+
+  while (question !== -1) {
+    let operand = question + 1;
+    while (operand < length && isWhitespace(text.charCodeAt(operand))) {
+      operand++;
+    }
+
+    if (operand >= lineEnd) {
+      lineEnd = operand;
+      lineColon = -1;
+      while (lineEnd < length && !isLineTerminator(text.charCodeAt(lineEnd))) {
+        if (text.charCodeAt(lineEnd) === COLON) {
+          lineColon = lineEnd;
+        }
+        lineEnd++;
+      }
+
+      let next = lineEnd;
+      while (next < length && isWhitespace(text.charCodeAt(next))) {
+        next++;
+      }
+      nextLineColon = next < length && text.charCodeAt(next) === COLON ? next : -1;
+    }
+
+    const colon = nextLineColon !== -1 ? nextLineColon : lineColon >= operand ? lineColon : -1;
+
+    if (colon !== -1) {
+      count++;
+      question = text.indexOf('?', colon + 1);
+    } else {
+      question = text.indexOf('?', question + 1);
+    }
+  }
+
+  return count;
 }
 
@@ -1,3 +1,7 @@
+import { LineIndex } from '../lineIndex.js';
+import { createViolation } from '../violation.js';
+import { isWhitespace } from '../charCodes.js';
+
 export class NoTrailingWhitespaceRule {
   constructor() {
     this.name = 'NoTrailingWhitespace';
@@ -6,34 +10,37 @@ export class NoTrailingWhitespaceRule {
     this.description = 'Line has trailing whitespace';
   }
 
-  async check(filePath, content) {
+  async check(filePath, content, lineIndex = new LineIndex(content)) {
     const violations = [];
-    const lines = content.split('\n');
     
-    for (let i = 0; i < lines.length; i++) {
-      const line = lines[i];
-      const lineNumber = i + 1;
+    // Walk back from each line end over whitespace character codes; lines
+    // without trailing whitespace cost one comparison and are never sliced
+    for (let lineNumber = 1; lineNumber <= lineIndex.lineCount; lineNumber++) {
+      const start = lineIndex.lineStart(lineNumber);
+      const end = lineIndex.lineEnd(lineNumber);
+      let trimmedEnd = end;
+      
+      while (trimmedEnd > start && isWhitespace(content.charCodeAt(trimmedEnd - 1))) {
+        trimmedEnd--;
+      }
       
-      if (line.length > 0 && /\s+$/.test(line)) {
-        const trailingSpaces = line.match(/\s+$/)[0].length;
+      if (trimmedEnd < end) {
+        const trailingSpaces = end - trimmedEnd;
         
-        violations.push({
-          rule: this.name,
-          severity: this.severity,
+        violations.push(createViolation(
+          this,
           filePath,
-          line: lineNumber,
-          column: line.length - trailingSpaces + 1,
-          description: `Line has ${trailingSpaces} trailing whitespace character(s)`,
-          autoFixable: this.autoFixable,
-          context: {
+          lineNumber,
+          trimmedEnd - start + 1,
+          `Line has ${trailingSpaces} trailing whitespace character(s)`,
+          {
             trailingSpaces,
-            lineContent: line
+            lineContent: content.slice(start, end)
           }
-        });
+        ));
       }
     }
 
     return violations;
   }
 }
-
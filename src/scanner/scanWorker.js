@@ -0,0 +1,10 @@
+import { parentPort, workerData } from 'worker_threads';
+import { ApexScanner } from './apexScanner.js';
+
+// Worker entry point: scans batches of file paths handed out by workerPool.js
+const scanner = new ApexScanner(workerData.targetPath, workerData.options);
+
+parentPort.on('message', async ({ batchIndex, filePaths }) => {
+  const results = await scanner.scanPaths(filePaths);
+  parentPort.postMessage({ batchIndex, results });
+});
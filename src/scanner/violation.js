@@ -0,0 +1,21 @@
+/**
+ * Creates a violation record.
+ * Every rule builds violations through here so they all share one fixed
+ * property layout (one V8 hidden class), including fields the scanner sets
+ * later such as isTestCode. Adding properties after creation would give
+ * test-class violations a different shape than the rest, making the
+ * reporter and fixer loops that read every violation polymorphic.
+ */
+export function createViolation(rule, filePath, line, column, description, context, autoFixable = rule.autoFixable) {
+  return {
+    rule: rule.name,
+    severity: rule.severity,
+    filePath,
+    line,
+    column,
+    description,
+    autoFixable,
+    context,
+    isTestCode: false
+  };
+}
@@ -0,0 +1,46 @@
+import { Worker } from 'worker_threads';
+
+export const WORKER_BATCH_SIZE = 8;
+
+/**
+ * Scans file paths across a pool of worker threads.
+ * Paths are handed out in small batches so faster workers pick up more work.
+ * Results are returned in the same order as the input paths.
+ */
+export async function scanInWorkers(filePaths, { workers, targetPath, options }) {
+  const batches = [];
+  for (let i = 0; i < filePaths.length; i += WORKER_BATCH_SIZE) {
+    batches.push(filePaths.slice(i, i + WORKER_BATCH_SIZE));
+  }
+
+  const batchResults = new Array(batches.length);
+  let nextBatch = 0;
+
+  const runWorker = () => new Promise((resolve, reject) => {
+    const worker = new Worker(new URL('./scanWorker.js', import.meta.url), {
+      workerData: { targetPath, options }
+    });
+
+    const dispatch = () => {
+      if (nextBatch >= batches.length) {
+        worker.terminate().then(() => resolve(), reject);
+        return;
+      }
+      const batchIndex = nextBatch++;
+      worker.postMessage({ batchIndex, filePaths: batches[batchIndex] });
+    };
+
+    worker.on('message', ({ batchIndex, results }) => {
+      batchResults[batchIndex] = results;
+      dispatch();
+    });
+    worker.on('error', reject);
+
+    dispatch();
+  });
+
+  const poolSize = Math.min(workers, batches.length);
+  await Promise.all(Array.from({ length: poolSize }, runWorker));
+
+  return batchResults.flat();
+}
@@ -18,9 +18,11 @@ export class Verifier {
     const scanner = new ApexScanner(this.targetPath);
     const newScanResults = await scanner.scan();
 
+    const newLinesByKey = this.indexLines(newScanResults.violations, v => `${v.rule}\0${v.filePath}`);
+
     for (const fixedItem of fixResults.fixed) {
       const originalViolation = fixedItem.violation;
-      const stillExists = this.violationStillExists(newScanResults.violations, originalViolation);
+      const stillExists = this.violationStillExists(newLinesByKey, originalViolation);
 
       if (!stillExists) {
         verified.push(fixedItem);
@@ -57,21 +59,45 @@ export class Verifier {
     };
   }
 
-  violationStillExists(newViolations, originalViolation) {
-    return newViolations.some(v =>
-      v.rule === originalViolation.rule &&
-      v.filePath === originalViolation.filePath &&
-      Math.abs(v.line - originalViolation.line) <= 5
+  /**
+   * Groups violation line numbers by key, so lookups only visit
+   * violations of the same rule (and file) instead of the whole list
+   */
+  indexLines(violations, keyOf) {
+    const index = new Map();
+
+    for (const violation of violations) {
+      const key = keyOf(violation);
+      const lines = index.get(key);
+      if (lines) {
+        lines.push(violation.line);
+      } else {
+        index.set(key, [violation.line]);
+      }
+    }
+
+    return index;
+  }
+
+  hasNearbyLine(lines, line) {
+    return lines !== undefined && lines.some(l => Math.abs(l - line) <= 5);
+  }
+
+  violationStillExists(newLinesByKey, originalViolation) {
+    return this.hasNearbyLine(
+      newLinesByKey.get(`${originalViolation.rule}\0${originalViolation.filePath}`),
+      originalViolation.line
     );
   }
 
   findIntroducedViolations(originalViolations, newViolations) {
     const introduced = [];
+    const originalLinesByRule = this.indexLines(originalViolations, v => v.rule);
 
     for (const newViolation of newViolations) {
-      const existedBefore = originalViolations.some(v =>
-        v.rule === newViolation.rule &&
-        Math.abs(v.line - newViolation.line) <= 5
+      const existedBefore = this.hasNearbyLine(
+        originalLinesByRule.get(newViolation.rule),
+        newViolation.line
       );
 
       if (!existedBefore) {
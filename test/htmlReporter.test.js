@@ -0,0 +1,29 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { HtmlReporter } from '../src/reporter/htmlReporter.js';
+
+test('rule groups escape file paths, descriptions and fix messages', () => {
+  const reporter = new HtmlReporter('/reports');
+  const filePath = 'classes/R&D/<Svc>.cls';
+  const violation = {
+    rule: 'AvoidDebugStatements',
+    filePath,
+    line: 3,
+    description: "Remove 'System.debug' <call>"
+  };
+  const key = `${violation.rule}-${violation.filePath}-${violation.line}`;
+  const ruleGroup = {
+    count: 1,
+    remediation: 'Use a logger & remove debug output',
+    files: { [filePath]: { count: 1, violations: [violation] } }
+  };
+
+  const html = reporter.buildRuleGroup('AvoidDebugStatements', ruleGroup, new Map(), new Map([[key, 'Failed: <script>']]), 'tier-3');
+
+  assert.ok(html.includes('classes/R&amp;D/&lt;Svc&gt;.cls'));
+  assert.ok(html.includes('Remove &#039;System.debug&#039; &lt;call&gt;'));
+  assert.ok(html.includes('Failed: &lt;script&gt;'));
+  assert.ok(html.includes('Use a logger &amp; remove debug output'));
+  assert.ok(!html.includes('<script>'));
+  assert.ok(!html.includes('<Svc>'));
+});
@@ -0,0 +1,119 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { ApexScanner } from '../src/scanner/apexScanner.js';
+import { CognitiveComplexityRule } from '../src/scanner/rules/cognitiveComplexity.js';
+
+const scanner = new ApexScanner('/project', { includeTestClasses: true });
+
+function ruleViolations(violations, ruleName) {
+  return violations.filter(violation => violation.rule === ruleName);
+}
+
+test('class declaration after a lone carriage return is not a sharing violation', async () => {
+  const violations = await scanner.scanFile('/project/A.cls', 'int x;\rpublic class Foo {\n}');
+
+  assert.deepEqual(ruleViolations(violations, 'ApexSharingViolation'), []);
+});
+
+test('class declaration at the start of a line is a sharing violation', async () => {
+  const violations = await scanner.scanFile('/project/A.cls', 'public class Foo {\n}');
+  const sharing = ruleViolations(violations, 'ApexSharingViolation');
+
+  assert.equal(sharing.length, 1);
+  assert.equal(sharing[0].line, 1);
+  assert.equal(sharing[0].context.className, 'Foo');
+});
+
+test('method header repeated after a lone carriage return is reported once', async () => {
+  const content = 'public void m() {\rpublic x\n' + '  if (a) {}\n'.repeat(20) + '}\n';
+  const violations = await scanner.scanFile('/project/B.cls', content);
+
+  assert.equal(ruleViolations(violations, 'CognitiveComplexity').length, 1);
+});
+
+test('commented-out method is not scored with the next method body', async () => {
+  const complexBody = '  if (a) {}\n'.repeat(20);
+  const content = [
+    'public class Impl {',
+    '/*',
+    'public void oldImpl() {',
+    '}',
+    '*/',
+    'public void realImpl() {',
+    complexBody + '}',
+    '}'
+  ].join('\n');
+  const violations = await scanner.scanFile('/project/Impl.cls', content);
+  const methods = ruleViolations(violations, 'CognitiveComplexity').map(violation => violation.context.methodName);
+
+  assert.deepEqual(methods, ['realImpl']);
+});
+
+test('braces inside string literals do not move method bounds', async () => {
+  const content = [
+    'public class Braces {',
+    'public void opens() {',
+    "  String s = '{';",
+    '}',
+    'public void closes() {',
+    "  String s = '}';",
+    '  if (a) {}\n'.repeat(20) + '}',
+    '}'
+  ].join('\n');
+  const violations = await scanner.scanFile('/project/Braces.cls', content);
+  const complexity = ruleViolations(violations, 'CognitiveComplexity');
+
+  assert.deepEqual(complexity.map(violation => violation.context.methodName), ['closes']);
+  assert.equal(complexity[0].context.complexity, 20);
+});
+
+test('braces inside a multi-line block comment do not move method bounds', async () => {
+  const content = [
+    'public class Commented {',
+    'public void quiet() {',
+    '  /*',
+    '   {',
+    '  */',
+    '}',
+    'public void busy() {',
+    '  if (a) {}\n'.repeat(20) + '}',
+    '}'
+  ].join('\n');
+  const violations = await scanner.scanFile('/project/Commented.cls', content);
+  const methods = ruleViolations(violations, 'CognitiveComplexity').map(violation => violation.context.methodName);
+
+  assert.deepEqual(methods, ['busy']);
+});
+
+test('debug statement after a string containing // is reported', async () => {
+  const content = "public with sharing class Links {\n  void m() {\n    String u = 'http://example.com'; System.debug(u);\n  }\n}";
+  const violations = await scanner.scanFile('/project/Links.cls', content);
+  const debug = ruleViolations(violations, 'AvoidDebugStatements');
+
+  assert.equal(debug.length, 1);
+  assert.equal(debug[0].line, 3);
+});
+
+test('debug statement inside a multi-line block comment is not reported', async () => {
+  const content = "public with sharing class Quiet {\n  void m() {\n    /*\n    System.debug('x');\n    */\n  }\n}";
+  const violations = await scanner.scanFile('/project/Quiet.cls', content);
+
+  assert.deepEqual(ruleViolations(violations, 'AvoidDebugStatements'), []);
+});
+
+// The ternary count must keep matching the original /\?\s*.*\s*:/g regex
+const LEGACY_TERNARY_PATTERN = /\?\s*.*\s*:/g;
+
+for (const [name, body] of [
+  ['operand on the next line', 'x ?\n  a : b;'],
+  ['colon on the following line', 'x ? a\n  : b;'],
+  ['several question marks with one colon', 'a ? b ? c ? d : e;'],
+  ['question mark without a colon', 'a ? b;']
+]) {
+  test(`ternary score matches the legacy regex: ${name}`, () => {
+    const rule = new CognitiveComplexityRule();
+    const expected = (body.match(LEGACY_TERNARY_PATTERN) || []).length;
+
+    assert.equal(rule.scoreComplexity(body), expected);
+  });
+}